@@ -4,25 +4,29 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-from enum import Enum, auto
-from typing import Optional, Deque, List, Tuple
+from enum import IntEnum, auto
+from typing import Optional, Deque, Dict, Iterable, Iterator, List, Tuple
 from collections import deque
+from itertools import chain
+from functools import lru_cache
 import random
 
-from PySide6.QtCore import QTimer, QSize
+from PySide6.QtCore import Qt, QTimer, QSize, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QColor, QBrush
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QLabel, QPushButton, QTableWidget, QTableWidgetItem,
-    QHeaderView, QVBoxLayout, QHBoxLayout, QGroupBox, QSizePolicy, QScrollArea, QToolButton, QStyle, QInputDialog
+    QApplication, QMainWindow, QWidget, QLabel, QPushButton, QTableView,
+    QHeaderView, QVBoxLayout, QHBoxLayout, QGroupBox, QSizePolicy, QScrollArea, QToolButton, QStyle, QInputDialog, QSpinBox
 )
 
 # --------- Constantes ---------
 DEFAULT_TICK_MS = 800
+REDRAW_MS = 16  # repintado de tablas como máximo ~60 veces por segundo
 P_BLOCK_IO = 0.05
 P_DEPEND_ON_ADMIT = 0.15
 P_DEPEND_REPLY = 0.45
 P_FINISH_TO_ZOMBIE = 0.10
 FINISHED_TTL = 6
+STEP_BATCH = 10  # ticks del botón "Paso +10"
 
 APPS_50 = [
     "Word","Excel","PowerPoint","Outlook","OneNote",
@@ -38,7 +42,9 @@ APPS_50 = [
 ]
 
 # ---------------- Enumerados ----------------
-class ProcessState(Enum):
+# IntEnum: se hashean y comparan como int (en C), y se usan como clave de
+# diccionario en cada tick y en cada fila de la tabla
+class ProcessState(IntEnum):
     NEW = auto()
     READY = auto()
     RUNNING = auto()
@@ -46,11 +52,11 @@ class ProcessState(Enum):
     FINISHED = auto()
     ZOMBIE = auto()
 
-class BlockReason(Enum):
+class BlockReason(IntEnum):
     IO = auto()
     DEPENDENCY = auto()
 
-class Priority(Enum):
+class Priority(IntEnum):
     HIGH = auto()
     MEDIUM = auto()
     LOW = auto()
@@ -66,6 +72,8 @@ STATE_COLORS = {
     ProcessState.FINISHED: QColor(120,120,120),
     ProcessState.ZOMBIE: QColor(220,38,38),
 }
+# Un pincel por estado, compartido por todas las celdas
+STATE_BRUSHES = {st: QBrush(c) for st, c in STATE_COLORS.items()}
 
 STATE_LABEL_ES = {
     ProcessState.RUNNING: "Ejecución",
@@ -79,7 +87,7 @@ REASON_LABEL_ES = {
 }
 
 # ---------------- Modelo de proceso ----------------
-@dataclass
+@dataclass(slots=True)
 class Process:
     pid: int
     name: str
@@ -91,6 +99,7 @@ class Process:
     waiting_for_pid: Optional[int] = None
     io_remaining: int = 0
     priority: Priority = Priority.MEDIUM
+    max_quantum: int = 3  # PRIO_QUANTUM[priority], fijado al crear
     # Consumo simulado
     cpu_base: float = 0.0
     mem_base: int = 0
@@ -107,55 +116,101 @@ class Process:
     def set_state(self, st: ProcessState):
         self.state = st
 
+def _jitter(u: float, val: float, lo: float, hi: float, scale: float=0.1) -> float:
+    # u es una tirada uniforme en [0,1). Expresiones condicionales en lugar de max()/min():
+    # se llama 3 veces por proceso y tick
+    v = val + (u*2-1) * scale * (val if val > 1.0 else 1.0)
+    return lo if v < lo else hi if v > hi else v
+
+# ---------------- Cola de listos ----------------
+class ReadyQueue:
+    # Cola de prioridad por cubos: un FIFO por clase, inserción y extracción O(1).
+    # El orden dentro de la clase es de llegada; el RR ponderado decide qué cubo atender.
+    def __init__(self, classes: Iterable[Priority]):
+        self._classes = tuple(classes)
+        self._buckets: Dict[Priority, Deque[Process]] = {c: deque() for c in self._classes}
+        self._len: int = 0
+
+    def push(self, p: Process):
+        self._buckets[p.priority].append(p)
+        self._len += 1
+
+    def pop(self, prio: Priority) -> Optional[Process]:
+        dq = self._buckets[prio]
+        if not dq: return None
+        self._len -= 1
+        return dq.popleft()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Process]:
+        return chain.from_iterable(self._buckets[c] for c in self._classes)
+
 # ---------------- Planificador ----------------
+def _flatten_wrr(cycle: List[Priority], weights: Dict[Priority, int]) -> Tuple[tuple, tuple]:
+    sched = tuple(c for c in cycle for _ in range(weights[c]))
+    skip = tuple(next((j for j in range(i + 1, len(sched)) if sched[j] != sched[i]), 0)
+                 for i in range(len(sched)))
+    return sched, skip
+
 class Scheduler:
     def _find_pid(self, pid: int | None):
         if pid is None:
             return None
-        pools = []
-        if self.running: pools.append([self.running])
-        pools += [list(self.ready), self.blocked, self.finished, self.zombies, self.new]
-        for pool in pools:
-            for p in pool:
-                if p.pid == pid:
-                    return p
-        return None
+        return self._by_pid.get(pid)
 
     def _reap_children_of(self, parent_pid: int):
         # Simula wait(): elimina de la tabla los zombies cuyo padre es parent_pid
-        if not self.zombies:
+        if self._zombie_parents.pop(parent_pid, 0) == 0:
             return
-        self.zombies = [z for z in self.zombies if z.parent_pid != parent_pid]
+        keep = []
+        for z in self.zombies:
+            if z.parent_pid == parent_pid: self._forget(z)
+            else: keep.append(z)
+        if len(keep) != len(self.zombies): self.done_version += 1
+        self.zombies = keep
     
     WRR_WEIGHTS = {Priority.HIGH:3, Priority.MEDIUM:2, Priority.LOW:2}
     PRIO_CYCLE = [Priority.HIGH, Priority.MEDIUM, Priority.LOW]
+    # Ciclo WRR aplanado: cada clase repetida según su peso (H,H,H,M,M,L,L).
+    # _WRR_SKIP[i] es el inicio de la clase siguiente: si la clase de i está vacía
+    # pierde el resto de su turno, igual que al agotar el presupuesto
+    _WRR_SCHEDULE, _WRR_SKIP = _flatten_wrr(PRIO_CYCLE, WRR_WEIGHTS)
 
     def __init__(self):
         self.time: int = 0
         self.next_pid: int = 1
 
         self.new: List[Process] = []
-        self.ready: Deque[Process] = deque()
-        self.blocked: List[Process] = []
+        self.ready = ReadyQueue(self.PRIO_CYCLE)
+        # Bloqueados separados por razón: cada paso del tick recorre solo su grupo
+        self.blocked_io: List[Process] = []
+        self.blocked_dep: Dict[int, Process] = {}  # pid -> proceso, en orden de bloqueo
         self.finished: List[Process] = []
         self.zombies: List[Process] = []
+        # Cambia cada vez que se modifica finished o zombies (sus filas no cambian solas)
+        self.done_version: int = 0
         self.running: Optional[Process] = None
+        # Índices mantenidos al crear/eliminar procesos
+        self._names: set[str] = set()
+        self._by_pid: Dict[int, Process] = {}
+        self._waiters: Dict[int, List[Process]] = {}  # pid destino -> bloqueados por dependencia
+        self._zombie_parents: Dict[int, int] = {}  # pid padre -> nº de hijos en zombies
 
         self._rnd = random.Random()
         self._quantum_used: int = 0
 
-        self._wrr_idx: int = 0
-        self._wrr_budget: int = self.WRR_WEIGHTS[self.PRIO_CYCLE[self._wrr_idx]]
+        self._wrr_pos: int = 0  # posición en _WRR_SCHEDULE
 
     # ---- utilidades ----
-    def _all_processes(self) -> List[Process]:
-        out = []
-        if self.running: out.append(self.running)
-        out += list(self.ready) + self.blocked + self.finished + self.zombies + self.new
-        return out
+    def _forget(self, p: Process):
+        # El proceso sale de la simulación
+        self._names.discard(p.name)
+        self._by_pid.pop(p.pid, None)
 
     def unique_name(self, base: str) -> str:
-        names = {p.name for p in self._all_processes()}
+        names = self._names
         if base not in names: return base
         i = 1
         while True:
@@ -166,33 +221,62 @@ class Scheduler:
     def _random_app_name(self) -> str:
         return self.unique_name(self._rnd.choice(APPS_50))
 
+    def random_burst(self) -> int:
+        return self._rnd.randint(3, 10)
+
     def _init_resources(self) -> Tuple[float,int,float]:
         return self._rnd.uniform(5,30), self._rnd.randint(100,800), self._rnd.uniform(0.5,8.0)
 
-    def _jitter(self, val: float, lo: float, hi: float, scale: float=0.1) -> float:
-        delta = (self._rnd.random()*2-1) * scale * max(1.0, val)
-        return max(lo, min(hi, val + delta))
-
     def _update_resources_for(self, p: Process):
-        if p.state == ProcessState.RUNNING:
-            p.cpu_usage = self._jitter(max(p.cpu_usage, p.cpu_base+10), 1, 100, 0.15)
-            p.disk_usage = self._jitter(max(p.disk_usage, p.disk_base+1.0), 0.0, 60.0, 0.20)
-            p.mem_usage  = int(self._jitter(max(p.mem_usage, p.mem_base), 50, 4096, 0.03))
-        elif p.state in (ProcessState.READY, ProcessState.NEW):
-            p.cpu_usage = self._jitter(max(1.0, p.cpu_base*0.8), 1, 50, 0.10)
-            p.disk_usage = self._jitter(p.disk_base*0.7, 0.0, 20.0, 0.15)
-            p.mem_usage  = int(self._jitter(p.mem_base, 50, 4096, 0.02))
-        elif p.state == ProcessState.BLOCKED:
+        self._update_resources_of((p,), p.state)
+
+    # Los actualizadores ligan el generador una vez por lote y pasan la tirada a _jitter
+    def _res_running(self, procs: Iterable[Process]):
+        rnd = self._rnd.random
+        for p in procs:
+            p.cpu_usage = _jitter(rnd(), max(p.cpu_usage, p.cpu_base+10), 1, 100, 0.15)
+            p.disk_usage = _jitter(rnd(), max(p.disk_usage, p.disk_base+1.0), 0.0, 60.0, 0.20)
+            p.mem_usage  = int(_jitter(rnd(), max(p.mem_usage, p.mem_base), 50, 4096, 0.03))
+
+    def _res_waiting(self, procs: Iterable[Process]):
+        rnd = self._rnd.random
+        for p in procs:
+            p.cpu_usage = _jitter(rnd(), max(1.0, p.cpu_base*0.8), 1, 50, 0.10)
+            p.disk_usage = _jitter(rnd(), p.disk_base*0.7, 0.0, 20.0, 0.15)
+            p.mem_usage  = int(_jitter(rnd(), p.mem_base, 50, 4096, 0.02))
+
+    def _res_blocked(self, procs: Iterable[Process]):
+        rnd = self._rnd.random
+        for p in procs:
             p.cpu_usage = 0.0  # bloqueado no consume CPU
             base_disk = p.disk_base * (1.5 if p.block_reason == BlockReason.IO else 0.5)
-            p.disk_usage = self._jitter(base_disk, 0.0, 30.0, 0.12)
-            p.mem_usage  = int(self._jitter(p.mem_base, 50, 4096, 0.01))
-        elif p.state == ProcessState.FINISHED:
+            p.disk_usage = _jitter(rnd(), base_disk, 0.0, 30.0, 0.12)
+            p.mem_usage  = int(_jitter(rnd(), p.mem_base, 50, 4096, 0.01))
+
+    def _res_finished(self, procs: Iterable[Process]):
+        for p in procs:
             p.cpu_usage = 0.0; p.disk_usage = 0.0; p.mem_usage = 0
-        elif p.state == ProcessState.ZOMBIE:
-            p.cpu_usage = self._jitter(1.0, 0.0, 5.0, 0.10)
-            p.disk_usage = self._jitter(0.2, 0.0, 2.0, 0.10)
-            p.mem_usage  = int(self._jitter(min(128, max(10, p.mem_base*0.1)), 5, 256, 0.10))
+
+    def _res_zombie(self, procs: Iterable[Process]):
+        rnd = self._rnd.random
+        for p in procs:
+            p.cpu_usage = _jitter(rnd(), 1.0, 0.0, 5.0, 0.10)
+            p.disk_usage = _jitter(rnd(), 0.2, 0.0, 2.0, 0.10)
+            p.mem_usage  = int(_jitter(rnd(), min(128, max(10, p.mem_base*0.1)), 5, 256, 0.10))
+
+    # Tabla estado -> actualizador: una búsqueda en vez de la cadena if/elif
+    _RES_HANDLERS = {
+        ProcessState.RUNNING: _res_running,
+        ProcessState.READY: _res_waiting,
+        ProcessState.NEW: _res_waiting,
+        ProcessState.BLOCKED: _res_blocked,
+        ProcessState.FINISHED: _res_finished,
+        ProcessState.ZOMBIE: _res_zombie,
+    }
+
+    def _update_resources_of(self, procs: Iterable[Process], st: ProcessState):
+        # Cada contenedor comparte estado: el actualizador se elige una vez por lote
+        self._RES_HANDLERS[st](self, procs)
 
     # ---- API ----
     def create_process(self, burst: int, name: Optional[str]=None) -> Process:
@@ -200,157 +284,276 @@ class Scheduler:
             name = self._random_app_name()
         name = self.unique_name(name.strip())
         cpu, mem, disk = self._init_resources()
-        prio = random.choice([Priority.HIGH, Priority.MEDIUM, Priority.LOW])
+        prio = self._rnd.choice(self.PRIO_CYCLE)
         p = Process(pid=self.next_pid, name=name, arrival_time=self.time,
-                    burst_time=burst, remaining_time=burst, priority=prio,
+                    burst_time=burst, remaining_time=burst, priority=prio, max_quantum=PRIO_QUANTUM[prio],
                     cpu_base=cpu, mem_base=mem, disk_base=disk,
                     cpu_usage=cpu, mem_usage=mem, disk_usage=disk, parent_pid=self.running.pid if self.running else None)
         self.next_pid += 1
+        self._names.add(name)
+        self._by_pid[p.pid] = p
         self.new.append(p)
         return p
 
     def admit_all_new(self):
         if not self.new: return
-        active_pids = [q.pid for q in ( ([self.running] if self.running else []) + list(self.ready) + self.blocked )]
-        for p in list(self.new):
-            p.set_state(ProcessState.READY)
-            self.ready.append(p)
-            self.new.remove(p)
-            if active_pids and random.random() < P_DEPEND_ON_ADMIT:
-                target_pid = random.choice(active_pids)
+        running = [self.running] if self.running else []
+        active_pids = [q.pid for q in chain(running, self.ready, self.blocked_io, self.blocked_dep.values())]
+        rnd_random = self._rnd.random; push_ready = self.ready.push; READY = ProcessState.READY
+        for p in self.new:
+            if active_pids and rnd_random() < P_DEPEND_ON_ADMIT:
+                target_pid = self._rnd.choice(active_pids)
                 self._set_dependency(p, target_pid)
+            else:
+                p.state = READY
+                push_ready(p)
+        self.new.clear()
 
     # ---- RR ponderado ----
-    def _advance_wrr(self):
-        self._wrr_idx = (self._wrr_idx + 1) % len(self.PRIO_CYCLE)
-        self._wrr_budget = self.WRR_WEIGHTS[self.PRIO_CYCLE[self._wrr_idx]]
-
-    def _pop_ready_by_priority(self, prio: Priority) -> Optional[Process]:
-        for idx, cand in enumerate(self.ready):
-            if cand.priority == prio:
-                if idx == 0: return self.ready.popleft()
-                tmp = []
-                for _ in range(idx): tmp.append(self.ready.popleft())
-                p = self.ready.popleft()
-                for it in reversed(tmp): self.ready.appendleft(it)
-                return p
-        return None
-
     def choose_next(self) -> Optional[Process]:
         if not self.ready: return None
-        attempts = 0
-        max_attempts = len(self.PRIO_CYCLE)*(max(self.WRR_WEIGHTS.values())+1)
-        while attempts < max_attempts:
-            current_class = self.PRIO_CYCLE[self._wrr_idx]
-            has_candidate = any(p.priority == current_class for p in self.ready)
-            if not has_candidate or self._wrr_budget <= 0:
-                self._advance_wrr(); attempts += 1; continue
-            p = self._pop_ready_by_priority(current_class)
-            if p is None: self._advance_wrr(); attempts += 1; continue
-            self._wrr_budget -= 1
-            p.set_state(ProcessState.RUNNING); self._quantum_used = 0
-            return p
-        p = self.ready.popleft(); p.set_state(ProcessState.RUNNING); self._quantum_used = 0; return p
+        sched = self._WRR_SCHEDULE; i = self._wrr_pos
+        # Con algún listo, basta probar cada clase una vez
+        for _ in range(len(self.PRIO_CYCLE)):
+            p = self.ready.pop(sched[i])
+            if p is not None:
+                self._wrr_pos = (i + 1) % len(sched)
+                p.state = ProcessState.RUNNING; self._quantum_used = 0
+                return p
+            i = self._WRR_SKIP[i]
+        self._wrr_pos = i
+        return None
 
     # ---- Dependencias ----
     def _set_dependency(self, p: Process, target_pid: int):
-        try: self.ready.remove(p)
-        except ValueError: pass
         p.block_reason = BlockReason.DEPENDENCY
         p.waiting_for_pid = target_pid
         p.parent_pid = target_pid
-        p.set_state(ProcessState.BLOCKED)
-        self.blocked.append(p)
+        p.state = ProcessState.BLOCKED
+        self.blocked_dep[p.pid] = p
+        self._waiters.setdefault(target_pid, []).append(p)
+
+    def _release_waiters_of(self, pid: int) -> List[Process]:
+        # Saca de blocked_dep solo a los que esperan a pid, sin recorrer al resto
+        waiters = self._waiters.pop(pid, [])
+        blocked_dep = self.blocked_dep
+        for q in waiters: del blocked_dep[q.pid]
+        return waiters
 
     def _auto_reply_from(self, pid: int):
-        if random.random() >= P_DEPEND_REPLY: return
-        for q in list(self.blocked):
-            if q.block_reason == BlockReason.DEPENDENCY and q.waiting_for_pid == pid:
-                self.blocked.remove(q)
-                q.block_reason=None; q.waiting_for_pid=None
-                q.set_state(ProcessState.READY)
-                self.ready.append(q)
+        if pid not in self._waiters or self._rnd.random() >= P_DEPEND_REPLY: return
+        for q in self._release_waiters_of(pid):
+            q.block_reason=None; q.waiting_for_pid=None
+            q.state = ProcessState.READY
+            self.ready.push(q)
 
     def _zombify_waiters_of(self, pid: int):
-        for q in list(self.blocked):
-            if q.block_reason == BlockReason.DEPENDENCY and q.waiting_for_pid == pid:
-                self.blocked.remove(q)
-                q.block_reason=None; q.waiting_for_pid=None
-                q.set_state(ProcessState.ZOMBIE)
-                self.zombies.append(q)
+        for q in self._release_waiters_of(pid):
+            q.block_reason=None; q.waiting_for_pid=None
+            q.state = ProcessState.ZOMBIE
+            self._add_zombie(q)
+
+    def _add_zombie(self, q: Process):
+        self.zombies.append(q); self.done_version += 1
+        zp = self._zombie_parents; zp[q.parent_pid] = zp.get(q.parent_pid, 0) + 1
 
     # ---- Preempción ----
     def _preempt_running_if_needed(self):
         if not self.running: return
-        max_q = PRIO_QUANTUM[self.running.priority]
-        if self._quantum_used >= max_q and len(self.ready) > 0:
-            self.running.set_state(ProcessState.READY)
-            self.ready.append(self.running); self.running=None
+        if self._quantum_used >= self.running.max_quantum and len(self.ready) > 0:
+            self.running.state = ProcessState.READY
+            self.ready.push(self.running); self.running=None
 
     # ---- Tick ----
-    def tick(self):
+    def run_ticks(self, n: int):
+        # Avanza n ticks seguidos; los consumos solo son visuales, así que
+        # se recalculan únicamente en el último
+        for _ in range(n - 1): self.tick(update_resources=False)
+        if n > 0: self.tick()
+
+    def tick(self, update_resources: bool = True):
         self.time += 1
+        # Sistema vacío: solo corre el reloj
+        if not (self.running or self.new or self.ready or self.blocked_io or self.blocked_dep
+                or self.finished or self.zombies): return
+        rnd_random = self._rnd.random
+
+        # Los pasos poco frecuentes se saltan en línea cuando no hay nada que hacer,
+        # sin pagar la llamada: en la mayoría de ticks solo avanza el RUNNING
 
         # Admitir NEW y posibles dependencias
-        self.admit_all_new()
+        if self.new: self.admit_all_new()
 
         # Desbloqueo por I/O
-        for p in list(self.blocked):
-            if p.block_reason == BlockReason.IO and p.io_remaining > 0:
-                p.io_remaining -= 1
-                if p.io_remaining <= 0:
-                    self.blocked.remove(p)
-                    p.block_reason=None; p.set_state(ProcessState.READY)
-                    self.ready.append(p)
+        # La cuenta atrás se hace en el sitio (la tabla la muestra); la lista
+        # solo se reconstruye en los ticks en que alguien termina su I/O
+        if self.blocked_io:
+            expired = False
+            for p in self.blocked_io:
+                if p.io_remaining > 0:
+                    p.io_remaining -= 1
+                    if p.io_remaining <= 0: expired = True
+            if expired:
+                still_blocked = []; keep = still_blocked.append; push_ready = self.ready.push
+                READY = ProcessState.READY  # el acceso al miembro del Enum se resuelve una vez
+                for p in self.blocked_io:
+                    if p.io_remaining <= 0:
+                        p.block_reason=None; p.state = READY
+                        push_ready(p)
+                    else: keep(p)
+                self.blocked_io = still_blocked
 
         # Despacho
         if self.running is None:
             self.running = self.choose_next()
 
         # Ejecutar
-        if self.running:
-            self.running.has_executed = True
-            self._auto_reply_from(self.running.pid)
+        running = self.running
+        if running:
+            running.has_executed = True
+            if running.pid in self._waiters: self._auto_reply_from(running.pid)
 
             # Ejecuta un tick
-            self.running.remaining_time -= 1; self._quantum_used += 1
+            running.remaining_time -= 1; self._quantum_used += 1
 
             # ¿terminó?
-            if self.running.remaining_time <= 0:
-                finished_pid = self.running.pid
-                parent = self._find_pid(self.running.parent_pid)
+            if running.remaining_time <= 0:
+                finished_pid = running.pid
+                self.done_version += 1
+                parent = self._find_pid(running.parent_pid)
                 if parent is not None and parent.state != ProcessState.FINISHED:
                     # Padre vivo y aún no ha hecho wait(): queda en ZOMBIE
-                    self.running.set_state(ProcessState.ZOMBIE)
-                    self.zombies.append(self.running)
+                    running.state = ProcessState.ZOMBIE
+                    self._add_zombie(running)
                 else:
                     # Sin padre o padre terminado: el SO lo elimina (FINISHED normal)
-                    self.running.set_state(ProcessState.FINISHED)
-                    self.running.finished_at = self.time
-                    self.finished.append(self.running)
+                    running.state = ProcessState.FINISHED
+                    running.finished_at = self.time
+                    self._update_resources_for(running)  # FINISHED: consumo a cero, una sola vez
+                    self.finished.append(running)
                 self.running = None
                 self._zombify_waiters_of(finished_pid)
                 self._reap_children_of(finished_pid)
             else:
-                # Posible bloqueo I/O tras ejecutar
-                if random.random() < P_BLOCK_IO:
-                    self.running.block_reason = BlockReason.IO
-                    self.running.io_remaining = random.randint(3, 8)
-                    self.running.set_state(ProcessState.BLOCKED)
-                    self.blocked.append(self.running); self.running = None
+                # Posible bloqueo I/O tras ejecutar. Si r < P_BLOCK_IO, r/P_BLOCK_IO vuelve
+                # a ser uniforme en [0,1): se reutiliza para la duración (3..8) sin otra tirada
+                r = rnd_random()
+                if r < P_BLOCK_IO:
+                    running.block_reason = BlockReason.IO
+                    running.io_remaining = 3 + int(r / P_BLOCK_IO * 6)
+                    running.state = ProcessState.BLOCKED
+                    self.blocked_io.append(running); self.running = None
                 else:
                     self._preempt_running_if_needed()
 
                 # Recolección automática: el padre en ejecución 'wait()' a sus hijos zombies
         # Auto reaping while parent runs disabled; reaped on parent finish.
-        # Limpieza FINISHED
-        for p in list(self.finished):
-            if p.finished_at is not None and (self.time - p.finished_at) >= FINISHED_TTL:
-                self.finished.remove(p)
+        # Limpieza FINISHED: se añaden en orden de finished_at, así que los
+        # vencidos son siempre un prefijo de la lista
+        finished = self.finished; cutoff = self.time - FINISHED_TTL; k = 0
+        while k < len(finished) and finished[k].finished_at <= cutoff:
+            self._forget(finished[k]); k += 1
+        if k: del finished[:k]; self.done_version += 1
+
+        # Actualizar recursos (los FINISHED ya quedaron en cero al terminar)
+        if not update_resources: return
+        if self.running: self._update_resources_for(self.running)
+        self._update_resources_of(self.ready, ProcessState.READY)
+        if self.blocked_io or self.blocked_dep:
+            self._update_resources_of(chain(self.blocked_io, self.blocked_dep.values()), ProcessState.BLOCKED)
+        if self.zombies: self._update_resources_of(self.zombies, ProcessState.ZOMBIE)
+        # self.new siempre queda vacío tras admit_all_new: no hay recursos NEW que actualizar
+
+# ---------------- Modelo de tabla ----------------
+# Pocas combinaciones posibles (estado; razón x ticks de I/O 0..8): se memorizan
+@lru_cache(maxsize=None)
+def _state_text(st: ProcessState) -> str:
+    return STATE_LABEL_ES.get(st, st.name)
+
+@lru_cache(maxsize=None)
+def _reason_text(br: Optional[BlockReason], io_remaining: int) -> str:
+    if not br: return ""
+    t = REASON_LABEL_ES.get(br, br.name)
+    if br == BlockReason.IO and io_remaining > 0: t += f" ({io_remaining})"
+    return t
+
+class ProcessTableModel(QAbstractTableModel):
+    # Qt pide las celdas solo para las filas visibles: no se crean items por celda
+    HEADERS = ["PID","Nombre","Estado","Ticks restantes","Razón","Esperando PID","Prioridad"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Process] = []
+        self._running_pid: Optional[int] = None
+        self._keys: List[tuple] = []  # instantánea de lo mostrado por fila
+        self._cells: List[Optional[tuple]] = []  # textos ya formateados (None = pendiente)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole, _display=Qt.DisplayRole, _horizontal=Qt.Horizontal):
+        if orientation != _horizontal:
+            return super().headerData(section, orientation, role)  # numeración 1..N como antes
+        if role == _display:
+            return self.HEADERS[section]
+        return None
 
-        # Actualizar recursos
-        for p in self._all_processes():
-            self._update_resources_for(p)
+    def _format_row(self, key: tuple) -> tuple:
+        pid, name, st, remaining, br, io_remaining, waiting_for, prio, is_current_running = key
+        # Forzar 'Ejecución' y color verde solo si es el RUNNING actual.
+        # El último elemento es el pincel de fondo de la fila.
+        return (str(pid), name,
+                "Ejecución" if is_current_running else _state_text(st),
+                str(remaining),
+                _reason_text(br, io_remaining),
+                str(waiting_for) if waiting_for is not None else "",
+                PRIO_LABEL[prio],
+                STATE_BRUSHES.get(ProcessState.RUNNING if is_current_running else st))
+
+    def data(self, index, role=Qt.DisplayRole, _display=Qt.DisplayRole, _background=Qt.BackgroundRole):
+        # Los roles quedan ligados como argumentos: Qt llama a data() por cada celda pintada
+        if not index.isValid(): return None
+        if role != _display and role != _background: return None
+        # Las celdas se formatean una vez y se reutilizan mientras la fila no cambie:
+        # al pintar no se vuelve a consultar ningún diccionario por Enum
+        r = index.row()
+        cells = self._cells[r]
+        if cells is None: cells = self._cells[r] = self._format_row(self._keys[r])
+        return cells[index.column()] if role == _display else cells[-1]
+
+    def _row_key(self, p: Process) -> tuple:
+        # Todo lo que se muestra en la fila; si no cambia no hace falta repintarla
+        return (p.pid, p.name, p.state, p.remaining_time, p.block_reason, p.io_remaining,
+                p.waiting_for_pid, p.priority, p.pid == self._running_pid)
+
+    def set_processes(self, items: Iterable[Process], running_pid: Optional[int]):
+        rows = list(items)
+        self._running_pid = running_pid
+        keys = [self._row_key(p) for p in rows]
+        n, old_n = len(rows), len(self._rows)
+        # Cambios de tamaño por la cola: insertar/quitar filas sin resetear la vista
+        if n > old_n:
+            self.beginInsertRows(QModelIndex(), old_n, n - 1)
+            self._rows = self._rows + rows[old_n:]; self._keys = self._keys + keys[old_n:]
+            self._cells.extend([None] * (n - old_n))
+            self.endInsertRows()
+        elif n < old_n:
+            self.beginRemoveRows(QModelIndex(), n, old_n - 1)
+            del self._rows[n:]; del self._keys[n:]; del self._cells[n:]
+            self.endRemoveRows()
+        old, cells = self._keys, self._cells
+        self._rows = rows; self._keys = keys
+        # Avisar solo de los tramos de filas que cambiaron (y olvidar su texto)
+        last_col = len(self.HEADERS) - 1
+        r = 0
+        while r < n:
+            if keys[r] == old[r]: r += 1; continue
+            first = r
+            while r < n and keys[r] != old[r]: cells[r] = None; r += 1
+            self.dataChanged.emit(self.index(first, 0), self.index(r - 1, last_col))
 
 # ---------------- UI ----------------
 class MainWindow(QMainWindow):
@@ -359,6 +562,17 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Simulador — Estados de los Procesos")
         self.scheduler = Scheduler()
         self.timer = QTimer(self); self.timer.timeout.connect(self.on_tick)
+        # Repintado desacoplado del reloj de simulación
+        self._refresh_pending = False
+        self._refresh_timer = QTimer(self); self._refresh_timer.setSingleShot(True); self._refresh_timer.setInterval(REDRAW_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        # Vistas con datos pendientes de volcar (solo se repinta la visible)
+        self._dirty_grouped = self._dirty_unified = True
+        self._done_shown: Optional[tuple] = None  # (scheduler, done_version) volcado en tbl_done
+        # Último contenido mostrado en las etiquetas (coincide con el texto inicial)
+        self._last_time: int = 0
+        self._last_running_key: Optional[tuple] = None
+        self._ticks_per_frame: int = 1  # copia de spn_ticks, leída en cada disparo
         self.init_ui()
 
     def init_ui(self):
@@ -369,7 +583,10 @@ class MainWindow(QMainWindow):
         self.btn_toggle_view = QToolButton(); self.btn_toggle_view.setCheckable(True); self.btn_toggle_view.setAutoRaise(True)
         self.btn_toggle_view.setFixedSize(26, 26); self.btn_toggle_view.setIconSize(QSize(18, 18))
         self.btn_toggle_view.setToolTip("Alternar vista por estados")
-        self.btn_toggle_view.setIcon(self.style().standardIcon(QStyle.SP_FileDialogListView))
+        # Iconos de la vista resueltos una sola vez (clave: botón marcado = vista por estados)
+        self._view_icons = {True: self.style().standardIcon(QStyle.SP_FileDialogDetailedView),
+                            False: self.style().standardIcon(QStyle.SP_FileDialogListView)}
+        self.btn_toggle_view.setIcon(self._view_icons[False])
         self.btn_toggle_view.setStyleSheet("QToolButton { border: none; border-radius: 6px; padding: 2px; }"
                                            "QToolButton:checked { background-color: #3b82f6; }")
         self.btn_toggle_view.toggled.connect(self.on_toggle_view); header_bar.addWidget(self.btn_toggle_view)
@@ -377,51 +594,49 @@ class MainWindow(QMainWindow):
         self.btn_add = QPushButton("Agregar proceso")
         self.btn_start = QPushButton("▶ Iniciar"); self.btn_pause = QPushButton("⏸ Pausar reloj")
         self.btn_step = QPushButton("⏭ Paso +1 tick")
+        self.btn_step_n = QPushButton(f"⏩ Paso +{STEP_BATCH} ticks")
         self.btn_reset = QPushButton("Reiniciar")
+        # Ticks simulados por cada disparo del reloj (un solo repintado por disparo)
+        self.spn_ticks = QSpinBox(); self.spn_ticks.setRange(1, 50); self.spn_ticks.setValue(1)
+        self.spn_ticks.setPrefix("Ticks por paso de reloj: "); self.spn_ticks.setMinimumHeight(32)
+        self.spn_ticks.valueChanged.connect(self.on_ticks_per_frame)
 
         self.btn_add.clicked.connect(self.on_add)
         self.btn_start.clicked.connect(self.on_start)
         self.btn_pause.clicked.connect(self.on_pause_clock)
         self.btn_step.clicked.connect(self.on_step)
+        self.btn_step_n.clicked.connect(self.on_step_n)
         self.btn_reset.clicked.connect(self.on_reset)
 
-        for b in [self.btn_add, self.btn_start, self.btn_pause, self.btn_step, self.btn_reset]:
+        for b in [self.btn_add, self.btn_start, self.btn_pause, self.btn_step, self.btn_step_n, self.btn_reset]:
             b.setMinimumHeight(32); b.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
         controls_layout = QVBoxLayout(); controls_layout.addLayout(header_bar)
         controls_layout.addWidget(self.lbl_time); controls_layout.addWidget(self.lbl_running)
         controls_layout.addWidget(self.btn_add)
         controls_layout.addWidget(self.btn_start); controls_layout.addWidget(self.btn_pause)
-        controls_layout.addWidget(self.btn_step)
+        controls_layout.addWidget(self.spn_ticks)
+        controls_layout.addWidget(self.btn_step); controls_layout.addWidget(self.btn_step_n)
         controls_layout.addWidget(self.btn_reset); controls_layout.addStretch(1)
 
         controls_box = QGroupBox("Controles"); controls_box.setLayout(controls_layout)
         controls_container = QWidget(); vwrap = QVBoxLayout(controls_container); vwrap.addWidget(controls_box); vwrap.setContentsMargins(0,0,0,0)
         scroll = QScrollArea(); scroll.setWidgetResizable(True); scroll.setWidget(controls_container); scroll.setMinimumWidth(360); scroll.setMaximumWidth(420)
 
-        headers = ["PID","Nombre","Estado","Ticks restantes","Razón","Esperando PID","Prioridad"]
-        self.tbl_all = QTableWidget(0, len(headers)); self.tbl_all.setHorizontalHeaderLabels(headers)
-        self.tbl_all.setSortingEnabled(False)
-        self.tbl_all.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.tbl_all = self._make_table()
 
         processes_box = QGroupBox("Procesos"); pv = QVBoxLayout()
 
         self.unified_container = QWidget(); uvl = QVBoxLayout(self.unified_container); uvl.setContentsMargins(0,0,0,0); uvl.addWidget(self.tbl_all)
         self.grouped_container = QWidget(); gvl = QVBoxLayout(self.grouped_container); gvl.setContentsMargins(0,0,0,0)
 
-        self.tbl_ready = QTableWidget(0, len(headers)); self.tbl_ready.setHorizontalHeaderLabels(headers)
-        self.tbl_ready.setSortingEnabled(False)
-        self.tbl_ready.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.tbl_ready = self._make_table()
         box_rr = QGroupBox("EJECUCIÓN + Listo"); lay_rr = QVBoxLayout(); lay_rr.addWidget(self.tbl_ready); box_rr.setLayout(lay_rr); gvl.addWidget(box_rr)
 
-        self.tbl_blocked = QTableWidget(0, len(headers)); self.tbl_blocked.setHorizontalHeaderLabels(headers)
-        self.tbl_blocked.setSortingEnabled(False)
-        self.tbl_blocked.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.tbl_blocked = self._make_table()
         box_bp = QGroupBox("BLOQUEADO"); lay_bp = QVBoxLayout(); lay_bp.addWidget(self.tbl_blocked); box_bp.setLayout(lay_bp); gvl.addWidget(box_bp)
 
-        self.tbl_done = QTableWidget(0, len(headers)); self.tbl_done.setHorizontalHeaderLabels(headers)
-        self.tbl_done.setSortingEnabled(False)
-        self.tbl_done.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.tbl_done = self._make_table()
         box_dz = QGroupBox("FINALIZADO + ZOMBIE"); lay_dz = QVBoxLayout(); lay_dz.addWidget(self.tbl_done); box_dz.setLayout(lay_dz); gvl.addWidget(box_dz)
 
         self.grouped_container.hide(); pv.addWidget(self.unified_container); pv.addWidget(self.grouped_container); processes_box.setLayout(pv)
@@ -429,98 +644,126 @@ class MainWindow(QMainWindow):
         layout = QHBoxLayout(); layout.addWidget(scroll, 0); layout.addWidget(processes_box, 1); root.setLayout(layout)
         self.refresh_table_all()
 
+    def _make_table(self) -> QTableView:
+        tbl = QTableView(); tbl.setModel(ProcessTableModel(tbl))
+        tbl.setSortingEnabled(False)
+        tbl.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        return tbl
+
     # ---- Eventos ----
     def on_add(self):
         name, ok = QInputDialog.getText(self, "Nuevo proceso", "Nombre del proceso:")
         if not ok or not str(name).strip(): name = None
-        burst = random.randint(3, 10)
-        self.scheduler.create_process(burst, name=name)
+        self.scheduler.create_process(self.scheduler.random_burst(), name=name)
         self.scheduler.admit_all_new()
         # Sin autodespacho: quedará en "Listo" hasta el primer tick
-        self.refresh_current_view()
+        self._schedule_refresh()
 
     def on_start(self):
         if not self.timer.isActive():
             self.timer.start(DEFAULT_TICK_MS)
-        self.refresh_current_view()
+        self._schedule_refresh()
 
     def on_pause_clock(self):
         self.timer.stop()
 
     def on_step(self):
         if self.timer.isActive(): self.timer.stop()
-        self.on_tick()
+        self.scheduler.tick()
+        self._schedule_refresh()
+
+    def on_step_n(self):
+        # Varios ticks sin repintar entre medias: una sola actualización al final
+        if self.timer.isActive(): self.timer.stop()
+        self.scheduler.run_ticks(STEP_BATCH)
+        self._schedule_refresh()
 
     def on_reset(self):
         self.timer.stop(); self.scheduler = Scheduler()
-        self.refresh_current_view()
+        self._schedule_refresh()
+
+    def on_ticks_per_frame(self, n: int):
+        self._ticks_per_frame = n
 
     def on_tick(self):
-        self.scheduler.tick()
-        self.refresh_current_view()
+        self.scheduler.run_ticks(self._ticks_per_frame)
+        self._schedule_refresh()
 
     def on_toggle_view(self, checked: bool):
-        self.btn_toggle_view.setIcon(self.style().standardIcon(QStyle.SP_FileDialogDetailedView if checked else QStyle.SP_FileDialogListView))
-        if checked: self.unified_container.hide(); self.grouped_container.show(); self.refresh_tables_grouped()
-        else: self.grouped_container.hide(); self.unified_container.show(); self.refresh_table_all()
+        self.btn_toggle_view.setIcon(self._view_icons[checked])
+        if checked: self.unified_container.hide(); self.grouped_container.show()
+        else: self.grouped_container.hide(); self.unified_container.show()
+        # Solo se repinta si hubo cambios mientras estaba oculta
+        self._refresh_active_tables()
 
     # ---- Refresco tablas ----
     def update_labels(self):
-        self.lbl_time.setText(f"Tiempo: {self.scheduler.time}")
-        if self.scheduler.running:
+        # Solo se llama a setText cuando cambia lo que muestra la etiqueta
+        if self.scheduler.time != self._last_time:
+            self._last_time = self.scheduler.time
+            self.lbl_time.setText(f"Tiempo: {self.scheduler.time}")
+        run = self.scheduler.running
+        key = (run.pid, run.name, run.remaining_time, run.priority) if run else None
+        if key == self._last_running_key: return
+        self._last_running_key = key
+        if run:
             self.lbl_running.setText(
-                f"EJECUCIÓN: PID {self.scheduler.running.pid} ({self.scheduler.running.name}) "
-                f"(restante={self.scheduler.running.remaining_time}, prio={PRIO_LABEL[self.scheduler.running.priority]})"
+                f"EJECUCIÓN: PID {run.pid} ({run.name}) "
+                f"(restante={run.remaining_time}, prio={PRIO_LABEL[run.priority]})"
             )
         else:
             self.lbl_running.setText("EJECUCIÓN: -")
 
-    def _state_text(self, st: ProcessState) -> str:
-        return STATE_LABEL_ES.get(st, st.name)
-
-    def _reason_text(self, br: Optional[BlockReason], io_remaining: int) -> str:
-        if not br: return ""
-        t = REASON_LABEL_ES.get(br, br.name)
-        if br == BlockReason.IO and io_remaining > 0: t += f" ({io_remaining})"
-        return t
-
-    def _fill_table(self, tbl: QTableWidget, items: List[Process]):
-        tbl.setRowCount(len(items))
-        for r, p in enumerate(items):
-            # Forzar 'Ejecución' y color verde solo si es el RUNNING actual
-            is_current_running = (self.scheduler.running is not None and p.pid == self.scheduler.running.pid)
-            estado = "Ejecución" if is_current_running else self._state_text(p.state)
-            razon = self._reason_text(p.block_reason, p.io_remaining)
-            waitfor = str(p.waiting_for_pid) if p.waiting_for_pid is not None else ""
-            prio = PRIO_LABEL[p.priority]
-            cells = [str(p.pid), p.name, estado, str(p.remaining_time), razon, waitfor, prio]
-            for c, val in enumerate(cells):
-                item = QTableWidgetItem(val)
-                tbl.setItem(r, c, item)
-                _color_state = ProcessState.RUNNING if is_current_running else p.state
-                item.setBackground(QBrush(STATE_COLORS.get(_color_state)))
+    def _fill_table(self, tbl: QTableView, items: Iterable[Process]):
+        running_pid = self.scheduler.running.pid if self.scheduler.running is not None else None
+        tbl.model().set_processes(items, running_pid)
 
     def refresh_tables_grouped(self):
-        pro_running = [self.scheduler.running] if self.scheduler.running else []
-        self._fill_table(self.tbl_ready, [*pro_running, *list(self.scheduler.ready)])
-        self._fill_table(self.tbl_blocked, list(self.scheduler.blocked))
-        self._fill_table(self.tbl_done, [*list(self.scheduler.finished), *list(self.scheduler.zombies)])
+        sch = self.scheduler
+        pro_running = [sch.running] if sch.running else []
+        self._fill_table(self.tbl_ready, chain(pro_running, sch.ready))
+        # Las listas de bloqueados ya vienen separadas por razón desde el scheduler
+        self._fill_table(self.tbl_blocked, chain(sch.blocked_io, sch.blocked_dep.values()))
+        # Terminados/zombies solo se rellenan si esa parte del scheduler cambió
+        if self._done_shown != (sch, sch.done_version):
+            self._done_shown = (sch, sch.done_version)
+            self._fill_table(self.tbl_done, chain(sch.finished, sch.zombies))
 
     def refresh_table_all(self):
-        # RUNNING primero; luego el resto (READY, BLOQUEADO, ZOMBIE, FINISHED, NEW)
-        others: List[Process] = list(self.scheduler.ready) + list(self.scheduler.blocked) + list(self.scheduler.zombies) + list(self.scheduler.finished) + list(self.scheduler.new)
-        if self.scheduler.running:
-            items = [self.scheduler.running] + [p for p in others if p.pid != self.scheduler.running.pid]
-        else:
-            items = others
-        self._fill_table(self.tbl_all, items)
+        # RUNNING primero; luego el resto (READY, BLOQUEADO, ZOMBIE, FINISHED, NEW).
+        # El RUNNING nunca está en otra cola, así que no hace falta filtrarlo.
+        sch = self.scheduler
+        pro_running = [sch.running] if sch.running else []
+        self._fill_table(self.tbl_all, chain(pro_running, sch.ready, sch.blocked_io, sch.blocked_dep.values(),
+                                             sch.zombies, sch.finished, sch.new))
+
+    def _schedule_refresh(self):
+        # Throttle con flanco de subida y de bajada: la primera petición tras un periodo
+        # tranquilo se pinta al momento; las que llegan dentro de la ventana de
+        # REDRAW_MS se juntan en un único repintado al cerrarla
+        if self._refresh_timer.isActive():
+            self._refresh_pending = True
+            return
+        self.refresh_current_view()
+        self._refresh_timer.start()
+
+    def _do_refresh(self):
+        if self._refresh_pending:
+            self.refresh_current_view()
+            self._refresh_timer.start()  # nueva ventana tras el repintado final
+
+    def _refresh_active_tables(self):
+        # La vista oculta queda marcada y se rellena al mostrarse
+        if self.btn_toggle_view.isChecked():
+            if self._dirty_grouped: self.refresh_tables_grouped(); self._dirty_grouped = False
+        elif self._dirty_unified:
+            self.refresh_table_all(); self._dirty_unified = False
 
     def refresh_current_view(self):
+        self._refresh_pending = False
+        self._dirty_grouped = self._dirty_unified = True
         self.update_labels()
-        if self.btn_toggle_view.isChecked():
-            self.refresh_tables_grouped()
-        else:
-            self.refresh_table_all()
+        self._refresh_active_tables()
 
 def main():
     import sys